@@ -27,6 +27,10 @@ class LoadingType(Enum):
     NONE = "none"  # No loading indicator (for custom skeleton)
 
 # %% ../../nbs/patterns/async_loading.ipynb #7846ac20
+# Class strings for the loading indicator, computed once at import
+_LOADING_MESSAGE_CLS = str(m.t(4))
+_LOADING_WRAPPER_CLS = combine_classes(flex_display, items.center, justify.center, p(4))
+
 def AsyncLoadingContainer(
     container_id: str,  # HTML ID for the container
     load_url: str,  # URL to fetch content from
@@ -79,19 +83,14 @@ def AsyncLoadingContainer(
         # Add loading message if provided
         if loading_message:
             loading_indicator_parts.append(
-                P(loading_message, cls=str(m.t(4)))
+                P(loading_message, cls=_LOADING_MESSAGE_CLS)
             )
         
         # Wrap in centered flex container
         content_parts.append(
             Div(
                 *loading_indicator_parts,
-                cls=combine_classes(
-                    flex_display,
-                    items.center,
-                    justify.center,
-                    p(4)
-                )
+                cls=_LOADING_WRAPPER_CLS
             )
         )
     
@@ -6,6 +6,7 @@
 __all__ = ['Step', 'StepFlow']
 
 # %% ../../nbs/patterns/step_flow.ipynb #e2cd8b07
+import inspect
 from typing import Dict, Any, Optional, Callable, List
 from dataclasses import dataclass, field
 from fasthtml.common import *
@@ -413,7 +414,6 @@ def create_router(self:StepFlow,
     async def _call_on_enter(step_obj, state, request, sess):
         """Call on_enter hook if defined, return result or None."""
         if step_obj.on_enter:
-            import inspect
             if self.debug:
                 print(f"DEBUG StepFlow: Calling on_enter for step {step_obj.id}")
             if inspect.iscoroutinefunction(step_obj.on_enter):
@@ -509,7 +509,6 @@ def create_router(self:StepFlow,
 
         # Call on_leave hook if defined (after validation, before navigation)
         if current_step.on_leave:
-            import inspect
             if self.debug:
                 print(f"DEBUG StepFlow: Calling on_leave for step {current_step_id}")
             if inspect.iscoroutinefunction(current_step.on_leave):
@@ -531,7 +530,6 @@ def create_router(self:StepFlow,
             if self.on_complete:
                 state = self.get_workflow_state(sess)
                 # Check if completion handler is async
-                import inspect
                 if inspect.iscoroutinefunction(self.on_complete):
                     result = await self.on_complete(state, request)
                     if self.debug:
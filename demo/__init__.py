@@ -1,5 +1,7 @@
 """Shared imports and utilities for interaction pattern demos."""
 
+from functools import lru_cache
+
 # FastHTML core
 from fasthtml.common import *
 
@@ -10,7 +12,7 @@ from cjm_fasthtml_interactions.patterns.async_loading import AsyncLoadingContain
 from cjm_fasthtml_interactions.core.context import InteractionContext
 from cjm_fasthtml_interactions.core.html_ids import InteractionHtmlIds
 from cjm_fasthtml_app_core.core.html_ids import AppHtmlIds
-from cjm_fasthtml_app_core.core.htmx import handle_htmx_request
+from cjm_fasthtml_app_core.core.htmx import handle_htmx_request, is_htmx_request
 from cjm_fasthtml_app_core.core.layout import wrap_with_layout
 from cjm_fasthtml_design_system.buttons import buttons
 
@@ -28,3 +30,17 @@ from cjm_fasthtml_daisyui.components.data_input.select import select
 from cjm_fasthtml_daisyui.components.navigation.link import link, link_colors
 from cjm_fasthtml_daisyui.components.feedback.progress import progress, progress_colors
 from cjm_fasthtml_daisyui.utilities.semantic_colors import bg_dui
+
+
+def wrap_with_demo_layout(content):
+    """Wrap page content in the shared demo layout (navbar built once in demo_app)."""
+    # Import navbar from demo_app to avoid circular import
+    from demo_app import navbar
+    return wrap_with_layout(content, navbar=navbar)
+
+
+@lru_cache(maxsize=None)
+def wrap_static_with_demo_layout(content: NotStr):
+    """Wrap pre-rendered, request-independent content in the demo layout, building each page's layout once."""
+    # Returns the layout tree rather than HTML so FastHTML still adds the full-page <html>/<head> shell
+    return wrap_with_demo_layout(content)
@@ -1,170 +1,183 @@
 """AsyncLoadingContainer pattern demo - Async content loading with various loading indicators."""
 
+import asyncio
 import time
 from demo import *
 
 # Create APIRouter for async loading routes
 async_loading_ar = APIRouter(prefix="/async_loading")
 
+# Precomputed class strings for the example sections and loader containers
+_SECTION_CLS = str(m.b(8))
+_SECTION_INTRO_CLS = str(m.b(4))
+_PAGE_TITLE_CLS = combine_classes(font_size._3xl, font_weight.bold, m.b(6), text_align.center)
+_PAGE_INTRO_CLS = combine_classes(text_align.center, m.b(8), max_w._3xl, m.x.auto)
+_SECTION_TITLE_CLS = combine_classes(font_size._2xl, font_weight.bold, m.b(4))
+_LOADER_TITLE_CLS = combine_classes(font_weight.semibold, m.b(2))
+_LOADER_GRID_CLS = combine_classes(grid_display, grid_cols._1, grid_cols._3.md, gap._4, m.b(8))
+_PAGE_CLS = combine_classes(container, max_w._6xl, m.x.auto, p(8))
+_LOADED_CARD_CLS = combine_classes(card, card_body, bg_dui.base_100)
+_LOADED_TITLE_CLS = combine_classes(font_size.xl, font_weight.bold, m.b(2))
+_LOADED_LABEL_CLS = combine_classes(font_weight.semibold, m.b(1))
+_LOADER_CARD_CLS = combine_classes(card, bg_dui.base_100)
+_INNER_SWAP_CARD_CLS = combine_classes(card, card_body, bg_dui.base_200, p(8))
+
+
+def _build_page_content():
+    """Build the async loading demo page content."""
+    return Div(
+        H1("Async Loading Container Pattern", cls=_PAGE_TITLE_CLS),
+
+        P("The AsyncLoadingContainer pattern enables asynchronous content loading with customizable loading indicators.",
+          cls=_PAGE_INTRO_CLS),
+
+        # Example 1: Spinner loader
+        Div(
+            H2("Example 1: Spinner Loader", cls=_SECTION_TITLE_CLS),
+            P("Simple spinner with loading message",
+              cls=_SECTION_INTRO_CLS),
+            AsyncLoadingContainer(
+                container_id="spinner-demo",
+                load_url=async_loading_ar.content_spinner.to(),
+                loading_message="Loading content...",
+                container_cls=_LOADER_CARD_CLS
+            ),
+            cls=_SECTION_CLS
+        ),
+
+        # Example 2: Different loading styles
+        Div(
+            H2("Example 2: Different Loading Styles", cls=_SECTION_TITLE_CLS),
+            P("Various loading indicator styles from DaisyUI",
+              cls=_SECTION_INTRO_CLS),
+            _LOADING_STYLES_GRID,
+            cls=_SECTION_CLS
+        ),
+
+        # Example 3: innerHTML swap
+        Div(
+            H2("Example 3: Inner Content Swap", cls=_SECTION_TITLE_CLS),
+            P("Container persists, only inner content is swapped",
+              cls=_SECTION_INTRO_CLS),
+            AsyncLoadingContainer(
+                container_id="inner-swap-demo",
+                load_url=async_loading_ar.content_inner.to(),
+                swap="innerHTML",
+                loading_type=LoadingType.SPINNER,
+                container_cls=_INNER_SWAP_CARD_CLS
+            ),
+            cls=_SECTION_CLS
+        ),
+
+        cls=_PAGE_CLS
+    )
+
 
 @async_loading_ar
 def index(request):
     """Async loading patterns demo page."""
+    return handle_htmx_request(request, lambda: _PAGE_CONTENT, wrap_fn=wrap_static_with_demo_layout)
 
-    def async_content():
-        return Div(
-            H1("Async Loading Container Pattern",
-               cls=combine_classes(font_size._3xl, font_weight.bold, m.b(6), text_align.center)),
-
-            P("The AsyncLoadingContainer pattern enables asynchronous content loading with customizable loading indicators.",
-              cls=combine_classes(text_align.center, m.b(8), max_w._3xl, m.x.auto)),
-
-            # Example 1: Spinner loader
-            Div(
-                H2("Example 1: Spinner Loader",
-                   cls=combine_classes(font_size._2xl, font_weight.bold, m.b(4))),
-                P("Simple spinner with loading message",
-                  cls=combine_classes(m.b(4))),
-                AsyncLoadingContainer(
-                    container_id="spinner-demo",
-                    load_url=async_loading_ar.content_spinner.to(),
-                    loading_message="Loading content...",
-                    container_cls=str(combine_classes(card, bg_dui.base_100))
-                ),
-                cls=str(m.b(8))
-            ),
 
-            # Example 2: Different loading styles
-            Div(
-                H2("Example 2: Different Loading Styles",
-                   cls=combine_classes(font_size._2xl, font_weight.bold, m.b(4))),
-                P("Various loading indicator styles from DaisyUI",
-                  cls=combine_classes(m.b(4))),
-                Div(
-                    Div(
-                        H3("Dots", cls=combine_classes(font_weight.semibold, m.b(2))),
-                        AsyncLoadingContainer(
-                            container_id="dots-demo",
-                            load_url=async_loading_ar.content_dots.to(),
-                            loading_type=LoadingType.DOTS,
-                            loading_size="md",
-                            container_cls=str(combine_classes(card, bg_dui.base_100))
-                        )
-                    ),
-                    Div(
-                        H3("Ring", cls=combine_classes(font_weight.semibold, m.b(2))),
-                        AsyncLoadingContainer(
-                            container_id="ring-demo",
-                            load_url=async_loading_ar.content_ring.to(),
-                            loading_type=LoadingType.RING,
-                            loading_size="md",
-                            container_cls=str(combine_classes(card, bg_dui.base_100))
-                        )
-                    ),
-                    Div(
-                        H3("Ball", cls=combine_classes(font_weight.semibold, m.b(2))),
-                        AsyncLoadingContainer(
-                            container_id="ball-demo",
-                            load_url=async_loading_ar.content_ball.to(),
-                            loading_type=LoadingType.BALL,
-                            loading_size="md",
-                            container_cls=str(combine_classes(card, bg_dui.base_100))
-                        )
-                    ),
-                    cls=combine_classes(grid_display, grid_cols._1, grid_cols._3.md, gap._4, m.b(8))
-                ),
-                cls=str(m.b(8))
-            ),
+# Static parts of the loaded-content responses, rendered to HTML once at import.
+# The dots/ring/ball responses have no per-request data at all.
+_SPINNER_TITLE = NotStr(to_xml(H3("Content Loaded!", cls=_LOADED_TITLE_CLS)))
+_SPINNER_TEXT = NotStr(to_xml(P("This content was loaded asynchronously using HTMX after a 1.5 second delay.")))
+_INNER_TITLE = NotStr(to_xml(H3("Inner Content", cls=_LOADED_TITLE_CLS)))
+_INNER_TEXT = NotStr(to_xml((
+    P("This content replaced only the inner HTML of the container."),
+    P("The container div with its styling and ID persisted."),
+)))
 
-            # Example 3: innerHTML swap
-            Div(
-                H2("Example 3: Inner Content Swap",
-                   cls=combine_classes(font_size._2xl, font_weight.bold, m.b(4))),
-                P("Container persists, only inner content is swapped",
-                  cls=combine_classes(m.b(4))),
-                AsyncLoadingContainer(
-                    container_id="inner-swap-demo",
-                    load_url=async_loading_ar.content_inner.to(),
-                    swap="innerHTML",
-                    loading_type=LoadingType.SPINNER,
-                    container_cls=str(combine_classes(card, card_body, bg_dui.base_200, p(8)))
-                ),
-                cls=str(m.b(8))
-            ),
-
-            cls=combine_classes(
-                container,
-                max_w._6xl,
-                m.x.auto,
-                p(8)
-            )
-        )
 
-    from demo_app import navbar
-    return handle_htmx_request(
-        request,
-        async_content,
-        wrap_fn=lambda content: wrap_with_layout(content, navbar=navbar)
+def _loaded_card(label, container_id):
+    """Build the static card returned by a loader-style example."""
+    return Div(
+        P(label, cls=_LOADED_LABEL_CLS),
+        P("Loaded successfully!"),
+        id=container_id,
+        cls=_LOADED_CARD_CLS
     )
 
 
+_DOTS_CONTENT = _loaded_card("Dots loader", "dots-demo")
+_RING_CONTENT = _loaded_card("Ring loader", "ring-demo")
+_BALL_CONTENT = _loaded_card("Ball loader", "ball-demo")
+
+
+# The content endpoints simulate slow loads with asyncio.sleep, so a waiting
+# request yields the event loop instead of holding a threadpool worker.
 @async_loading_ar
-def content_spinner():
+async def content_spinner():
     """Return loaded content after delay (spinner example)."""
-    time.sleep(1.5)
+    await asyncio.sleep(1.5)
     return Div(
-        H3("Content Loaded!", cls=combine_classes(font_size.xl, font_weight.bold, m.b(2))),
-        P("This content was loaded asynchronously using HTMX after a 1.5 second delay."),
+        _SPINNER_TITLE,
+        _SPINNER_TEXT,
         P(f"Loaded at: {time.strftime('%H:%M:%S')}"),
         id="spinner-demo",
-        cls=combine_classes(card, card_body, bg_dui.base_100)
+        cls=_LOADED_CARD_CLS
     )
 
 
 @async_loading_ar
-def content_dots():
+async def content_dots():
     """Return loaded content for dots example."""
-    time.sleep(1)
-    return Div(
-        P("Dots loader", cls=combine_classes(font_weight.semibold, m.b(1))),
-        P("Loaded successfully!"),
-        id="dots-demo",
-        cls=combine_classes(card, card_body, bg_dui.base_100)
-    )
+    await asyncio.sleep(1)
+    return _DOTS_CONTENT
 
 
 @async_loading_ar
-def content_ring():
+async def content_ring():
     """Return loaded content for ring example."""
-    time.sleep(1.2)
-    return Div(
-        P("Ring loader", cls=combine_classes(font_weight.semibold, m.b(1))),
-        P("Loaded successfully!"),
-        id="ring-demo",
-        cls=combine_classes(card, card_body, bg_dui.base_100)
-    )
+    await asyncio.sleep(1.2)
+    return _RING_CONTENT
 
 
 @async_loading_ar
-def content_ball():
+async def content_ball():
     """Return loaded content for ball example."""
-    time.sleep(0.8)
-    return Div(
-        P("Ball loader", cls=combine_classes(font_weight.semibold, m.b(1))),
-        P("Loaded successfully!"),
-        id="ball-demo",
-        cls=combine_classes(card, card_body, bg_dui.base_100)
-    )
+    await asyncio.sleep(0.8)
+    return _BALL_CONTENT
 
 
 @async_loading_ar
-def content_inner():
+async def content_inner():
     """Return loaded content for innerHTML swap example."""
-    time.sleep(1)
+    await asyncio.sleep(1)
     # Note: No ID needed since we're swapping innerHTML
     return Div(
-        H3("Inner Content", cls=combine_classes(font_size.xl, font_weight.bold, m.b(2))),
-        P("This content replaced only the inner HTML of the container."),
-        P("The container div with its styling and ID persisted."),
+        _INNER_TITLE,
+        _INNER_TEXT,
         P(f"Loaded at: {time.strftime('%H:%M:%S')}")
     )
+
+
+# Loading-style examples: (heading, container id, loading type, content route).
+# The grid has no per-request data, so it is built once, after the content routes
+# it points at are defined.
+_LOADING_STYLE_EXAMPLES = (
+    ("Dots", "dots-demo", LoadingType.DOTS, async_loading_ar.content_dots),
+    ("Ring", "ring-demo", LoadingType.RING, async_loading_ar.content_ring),
+    ("Ball", "ball-demo", LoadingType.BALL, async_loading_ar.content_ball),
+)
+
+_LOADING_STYLES_GRID = Div(
+    *(
+        Div(
+            H3(heading, cls=_LOADER_TITLE_CLS),
+            AsyncLoadingContainer(
+                container_id=container_id,
+                load_url=route.to(),
+                loading_type=loading_type,
+                loading_size="md",
+                container_cls=_LOADER_CARD_CLS
+            )
+        )
+        for heading, container_id, loading_type, route in _LOADING_STYLE_EXAMPLES
+    ),
+    cls=_LOADER_GRID_CLS
+)
+
+# The page itself has no per-request data either, so it is rendered to HTML once
+_PAGE_CONTENT = NotStr(to_xml(_build_page_content()))
@@ -1,85 +1,105 @@
 """Homepage and features page for the demo app."""
 
 from demo import *
+from demo.step_flow_demo import step_flow_ar
+from demo.async_loading_demo import async_loading_ar
 
 # Create APIRouter for home routes
 home_ar = APIRouter(prefix="")
 
+# Precomputed class strings for the homepage
+_TITLE_CLS = combine_classes(font_size._4xl, font_weight.bold, m.b(4))
+_SUBTITLE_CLS = combine_classes(font_size.lg, m.b(6))
+_FEATURE_TITLE_CLS = combine_classes(font_weight.bold, m.b(2))
+_FEATURE_LIST_CLS = combine_classes(m.l(6), m.b(4))
+_LAST_FEATURE_LIST_CLS = combine_classes(m.l(6), m.b(8))
+_FEATURES_CLS = combine_classes(text_align.left, m.b(8))
+_NAV_BTN_CLS = combine_classes(buttons.page_primary, m.r(2), m.b(2))
+_PAGE_CLS = combine_classes(container, max_w._4xl, m.x.auto, p(8), text_align.center)
+
+# HTMX target for demo navigation links
+_HX_TARGET_MAIN = f"#{AppHtmlIds.MAIN_CONTENT}"
+
+# Feature summary shown on the homepage: (pattern name, list classes, bullet points)
+_FEATURES = (
+    ("StepFlow Pattern", _FEATURE_LIST_CLS, (
+        "Multi-step wizard workflows",
+        "Visual progress indicators",
+        "Form data collection",
+        "State management and resumability",
+    )),
+    ("AsyncLoadingContainer Pattern", _LAST_FEATURE_LIST_CLS, (
+        "Asynchronous content loading",
+        "Multiple loading-indicator styles",
+        "Customizable loading messages",
+        "Skeleton-loader support",
+    )),
+)
+
+# Let browsers reuse the homepage (FastHTML already sends `Vary: HX-Request`).
+# Kept private since the session middleware may attach a Set-Cookie header.
+_HOME_CACHE_CONTROL = HttpHeader("Cache-Control", "private, max-age=300, stale-while-revalidate=60")
+
+
+def _feature_section(title, list_cls, bullets):
+    """Render one pattern's feature list."""
+    return Div(
+        H3(title, cls=_FEATURE_TITLE_CLS),
+        Ul(*(Li(bullet) for bullet in bullets), cls=list_cls)
+    )
+
+
+# Feature sections don't depend on the demo routers, so they are built at import
+_FEATURE_SECTIONS = tuple(_feature_section(*feature) for feature in _FEATURES)
+
+
+# Demo navigation buttons: (label, router index route)
+_NAV_ITEMS = (
+    ("StepFlow Demo", step_flow_ar.index),
+    ("Async Loading Demo", async_loading_ar.index),
+)
+
+
+def _nav_button(label, route):
+    """Render an HTMX navigation button for a demo page."""
+    url = route.to()
+    return A(
+        label,
+        href=url,
+        hx_get=url,
+        hx_target=_HX_TARGET_MAIN,
+        hx_push_url="true",
+        cls=_NAV_BTN_CLS
+    )
+
+
+def _build_home_content():
+    """Build the homepage content (library overview and demo links)."""
+    return Div(
+        H1("cjm-fasthtml-interactions Demo", cls=_TITLE_CLS),
+
+        P("Reusable user interaction patterns for FastHTML applications:", cls=_SUBTITLE_CLS),
+
+        # Feature list
+        Div(
+            *_FEATURE_SECTIONS,
+            cls=_FEATURES_CLS
+        ),
+
+        # Navigation
+        # All patterns now use APIRouter with consistent HTMX navigation
+        Div(*(_nav_button(label, route) for label, route in _NAV_ITEMS)),
+
+        cls=_PAGE_CLS
+    )
+
+
+# Homepage content is request-independent, so it is rendered to HTML once at import
+_HOME_CONTENT = NotStr(to_xml(_build_home_content()))
+
 
 @home_ar
 def index(request):
     """Homepage with library overview."""
-    # Import here to avoid circular imports
-    from demo.step_flow_demo import step_flow_ar
-    from demo.async_loading_demo import async_loading_ar
-
-    def home_content():
-        return Div(
-            H1("cjm-fasthtml-interactions Demo",
-               cls=combine_classes(font_size._4xl, font_weight.bold, m.b(4))),
-
-            P("Reusable user interaction patterns for FastHTML applications:",
-              cls=combine_classes(font_size.lg, m.b(6))),
-
-            # Feature list
-            Div(
-                Div(
-                    H3("StepFlow Pattern", cls=combine_classes(font_weight.bold, m.b(2))),
-                    Ul(
-                        Li("Multi-step wizard workflows"),
-                        Li("Visual progress indicators"),
-                        Li("Form data collection"),
-                        Li("State management and resumability"),
-                        cls=combine_classes(m.l(6), m.b(4))
-                    )
-                ),
-                Div(
-                    H3("AsyncLoadingContainer Pattern", cls=combine_classes(font_weight.bold, m.b(2))),
-                    Ul(
-                        Li("Asynchronous content loading"),
-                        Li("Multiple loading-indicator styles"),
-                        Li("Customizable loading messages"),
-                        Li("Skeleton-loader support"),
-                        cls=combine_classes(m.l(6), m.b(8))
-                    )
-                ),
-                cls=combine_classes(text_align.left, m.b(8))
-            ),
-
-            # Navigation
-            Div(
-                # All patterns now use APIRouter with consistent HTMX navigation
-                A(
-                    "StepFlow Demo",
-                    href=step_flow_ar.index.to(),
-                    hx_get=step_flow_ar.index.to(),
-                    hx_target=f"#{AppHtmlIds.MAIN_CONTENT}",
-                    hx_push_url="true",
-                    cls=combine_classes(buttons.page_primary, m.r(2), m.b(2))
-                ),
-                A(
-                    "Async Loading Demo",
-                    href=async_loading_ar.index.to(),
-                    hx_get=async_loading_ar.index.to(),
-                    hx_target=f"#{AppHtmlIds.MAIN_CONTENT}",
-                    hx_push_url="true",
-                    cls=combine_classes(buttons.page_primary, m.r(2), m.b(2))
-                ),
-            ),
-
-            cls=combine_classes(
-                container,
-                max_w._4xl,
-                m.x.auto,
-                p(8),
-                text_align.center
-            )
-        )
-
-    # Import navbar from demo_app to avoid circular import
-    from demo_app import navbar
-    return handle_htmx_request(
-        request,
-        home_content,
-        wrap_fn=lambda content: wrap_with_layout(content, navbar=navbar)
-    )
+    content = handle_htmx_request(request, lambda: _HOME_CONTENT, wrap_fn=wrap_static_with_demo_layout)
+    return content, _HOME_CACHE_CONTROL
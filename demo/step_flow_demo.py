@@ -2,47 +2,78 @@
 
 from fasthtml.common import *
 from demo import *
-import asyncio
+from html import escape
 
 # Create APIRouter for step flow demo
 step_flow_ar = APIRouter(prefix="/step_flow")
 
+# Precomputed class strings for the step renderers
+_STEP_TITLE_CLS = combine_classes(font_size._2xl, font_weight.bold, m.b(4))
+_LABEL_CLS = combine_classes(font_weight.semibold, m.b(2))
+_INPUT_CLS = combine_classes(text_input, w.full)
+_SELECT_CLS = combine_classes(select, w.full)
+_CARD_BODY_CLS = str(card_body)
+_SUMMARY_CLS = str(p(4))
+_SUMMARY_ROW_CLS = str(m.b(2))
+_SUMMARY_LAST_ROW_CLS = str(m.b(4))
+_PAGE_HEADER_CLS = str(m.b(6))
+_PAGE_TITLE_CLS = combine_classes(font_size._3xl, font_weight.bold, m.b(2))
+_PAGE_INTRO_CLS = str(m.b(6))
+_PAGE_CLS = combine_classes(max_w._4xl, m.x.auto, p(6))
+_CONFIRM_HINT_CLS = combine_classes(text_align.center, m.t(4))
 
-# Define step render functions for registration workflow
+# HTMX target for links that restart the workflow in place
+_HX_TARGET_STEP_FLOW = f"#{InteractionHtmlIds.STEP_FLOW_CONTAINER}"
+
+
+# Static headings and labels shared by every render of their step, pre-rendered to
+# HTML so serializing a step only walks its value-dependent nodes
+_NAME_STEP_TITLE = NotStr(to_xml(H2("Enter Your Name", cls=_STEP_TITLE_CLS)))
+_NAME_LABEL = NotStr(to_xml(Label("Full Name:", cls=_LABEL_CLS)))
+_EMAIL_LABEL = NotStr(to_xml(Label("Email Address:", cls=_LABEL_CLS)))
+_PREFERENCES_STEP_TITLE = NotStr(to_xml(H2("Set Your Preferences", cls=_STEP_TITLE_CLS)))
+_NOTIFICATIONS_LABEL = NotStr(to_xml(Label("Notification Preferences:", cls=_LABEL_CLS)))
+_CONFIRM_STEP_TITLE = NotStr(to_xml(H2("Confirm Your Information", cls=_STEP_TITLE_CLS)))
+_CONFIRM_HINT = NotStr(to_xml(P("Click 'Complete Registration' to finish.", cls=_CONFIRM_HINT_CLS)))
+
+# Static Input attributes; only the current value varies between renders
+_NAME_INPUT_KW = dict(name="name", placeholder="John Doe", required=True, cls=_INPUT_CLS)
+_EMAIL_INPUT_KW = dict(name="email", type="email", placeholder="john@example.com",
+                       required=True, cls=_INPUT_CLS)
+
+# Notification choices as (value, unselected option, selected option), so a render
+# only picks prebuilt Option nodes instead of creating new ones. FT nodes are mutable,
+# so these shared instances must never be modified in place.
+_NOTIFICATION_OPTIONS = tuple(
+    (value, Option(label, value=value), Option(label, value=value, selected=True))
+    for value, label in (
+        ("daily", "Daily updates"),
+        ("weekly", "Weekly digest"),
+        ("monthly", "Monthly summary"),
+    )
+)
+
+
+# Define step render functions for registration workflow.
+# Static headings and labels come from the pre-rendered fragments above; only the
+# value-dependent nodes are built per render, and nothing keyed on user input is cached.
 def render_name_step(ctx: InteractionContext):
     """Render step 1 - collect name."""
-    current_name = ctx.get("name", "")
     return Div(
-        H2("Enter Your Name", cls=combine_classes(font_size._2xl, font_weight.bold, m.b(4))),
-        Label("Full Name:", cls=combine_classes(font_weight.semibold, m.b(2))),
-        Input(
-            name="name",
-            value=current_name,
-            placeholder="John Doe",
-            required=True,
-            cls=combine_classes(text_input, w.full)
-        ),
-        cls=combine_classes(card_body)
+        _NAME_STEP_TITLE,
+        _NAME_LABEL,
+        Input(value=ctx.get("name", ""), **_NAME_INPUT_KW),
+        cls=_CARD_BODY_CLS
     )
 
 
 def render_email_step(ctx: InteractionContext):
     """Render step 2 - collect email."""
-    name = ctx.get("name", "there")
-    current_email = ctx.get("email", "")
     return Div(
-        H2(f"Hi {name}! What's your email?",
-           cls=combine_classes(font_size._2xl, font_weight.bold, m.b(4))),
-        Label("Email Address:", cls=combine_classes(font_weight.semibold, m.b(2))),
-        Input(
-            name="email",
-            type="email",
-            value=current_email,
-            placeholder="john@example.com",
-            required=True,
-            cls=combine_classes(text_input, w.full)
-        ),
-        cls=combine_classes(card_body)
+        H2(f"Hi {ctx.get('name', 'there')}! What's your email?", cls=_STEP_TITLE_CLS),
+        _EMAIL_LABEL,
+        Input(value=ctx.get("email", ""), **_EMAIL_INPUT_KW),
+        cls=_CARD_BODY_CLS
     )
 
 
@@ -50,45 +81,37 @@ def render_preferences_step(ctx: InteractionContext):
     """Render step 3 - collect preferences."""
     current_notifications = ctx.get("notifications", "")
     return Div(
-        H2("Set Your Preferences",
-           cls=combine_classes(font_size._2xl, font_weight.bold, m.b(4))),
-        Label("Notification Preferences:", cls=combine_classes(font_weight.semibold, m.b(2))),
+        _PREFERENCES_STEP_TITLE,
+        _NOTIFICATIONS_LABEL,
         Select(
-            Option("Daily updates", value="daily", selected=(current_notifications == "daily")),
-            Option("Weekly digest", value="weekly", selected=(current_notifications == "weekly")),
-            Option("Monthly summary", value="monthly", selected=(current_notifications == "monthly")),
+            *(selected if value == current_notifications else option
+              for value, option, selected in _NOTIFICATION_OPTIONS),
             name="notifications",
-            cls=combine_classes(select, w.full)
+            cls=_SELECT_CLS
         ),
-        cls=combine_classes(card_body)
+        cls=_CARD_BODY_CLS
     )
 
 
 def render_confirm_step(ctx: InteractionContext):
     """Render step 4 - confirmation."""
-    name = ctx.get("name", "")
-    email = ctx.get("email", "")
-    notifications = ctx.get("notifications", "")
     return Div(
-        H2("Confirm Your Information",
-           cls=combine_classes(font_size._2xl, font_weight.bold, m.b(4))),
+        _CONFIRM_STEP_TITLE,
         Div(
-            P(Strong("Name: "), name, cls=str(m.b(2))),
-            P(Strong("Email: "), email, cls=str(m.b(2))),
-            P(Strong("Notifications: "), notifications.title(), cls=str(m.b(4))),
-            P("Click 'Complete Registration' to finish.",
-              cls=combine_classes(text_align.center, m.t(4))),
-            cls=combine_classes(p(4))
+            P(Strong("Name: "), ctx.get("name", ""), cls=_SUMMARY_ROW_CLS),
+            P(Strong("Email: "), ctx.get("email", ""), cls=_SUMMARY_ROW_CLS),
+            P(Strong("Notifications: "), ctx.get("notifications", "").title(), cls=_SUMMARY_LAST_ROW_CLS),
+            _CONFIRM_HINT,
+            cls=_SUMMARY_CLS
         ),
-        cls=combine_classes(card_body)
+        cls=_CARD_BODY_CLS
     )
 
 
 # Define completion handler
-def on_registration_complete(state: dict, request):
-    """Handle registration completion."""
-    name = state.get("name", "")
-    email = state.get("email", "")
+def _build_completion_card(name, email):
+    """Build the registration-complete card for the given name and email."""
+    reset_url = registration_router.reset.to()
     return Div(
         Div(
             H2("Registration Complete! 🎉",
@@ -100,25 +123,52 @@ def on_registration_complete(state: dict, request):
             Div(
                 A(
                     "Start Another Registration",
-                    href=registration_router.reset.to(),
-                    hx_get=registration_router.reset.to(),
-                    hx_target=f"#{InteractionHtmlIds.STEP_FLOW_CONTAINER}",
+                    href=reset_url,
+                    hx_get=reset_url,
+                    hx_target=_HX_TARGET_STEP_FLOW,
                     hx_push_url="true",
                     cls=buttons.page_primary
                 ),
-                cls=combine_classes(text_align.center)
+                cls=str(text_align.center)
             ),
-            cls=combine_classes(card_body)
+            cls=_CARD_BODY_CLS
         ),
         cls=combine_classes(card, max_w.lg, m.x.auto, m.t(8))
     )
 
 
+# The completion card only varies by name and email, so it is serialized once
+# into a str.format template and filled in per completion
+_COMPLETION_TEMPLATE = None
+
+
+def _completion_template():
+    """Serialize the completion card once, with {name}/{email} placeholders."""
+    global _COMPLETION_TEMPLATE
+    if _COMPLETION_TEMPLATE is None:
+        html = to_xml(_build_completion_card("__NAME__", "__EMAIL__"))
+        # Escape literal braces before inserting the format fields
+        html = html.replace("{", "{{").replace("}", "}}")
+        _COMPLETION_TEMPLATE = html.replace("__NAME__", "{name}").replace("__EMAIL__", "{email}")
+    return _COMPLETION_TEMPLATE
+
+
+def on_registration_complete(state: dict, request):
+    """Handle registration completion."""
+    # Values are user input, so escape them before splicing into raw HTML
+    return NotStr(_completion_template().format(
+        name=escape(state.get("name", "")),
+        email=escape(state.get("email", ""))
+    ))
+
+
 # Create registration step flow with progress indicator
-# StepFlow uses InMemoryWorkflowStateStore by default for server-side state storage
+# The in-memory store is passed explicitly so step transitions never touch disk or
+# the network; state is lost on restart and is not shared across worker processes
 registration_flow = StepFlow(
     flow_id="registration",
-    steps=[
+    state_store=InMemoryWorkflowStateStore(),
+    steps=(
         Step(
             id="name",
             title="Name",
@@ -142,8 +192,8 @@ registration_flow = StepFlow(
             title="Confirm",
             render=render_confirm_step,
             next_button_text="Complete Registration"
-        )
-    ],
+        ),
+    ),
     on_complete=on_registration_complete,
     show_progress=True
 )
@@ -152,7 +202,16 @@ registration_flow = StepFlow(
 registration_router = registration_flow.create_router(prefix="/workflow")
 
 
-def render_registration_page(request, sess):
+# The page header has no per-request inputs, so it is rendered to HTML once and reused
+_PAGE_HEADER = NotStr(to_xml(Div(
+    H1("Registration Wizard", cls=_PAGE_TITLE_CLS),
+    P("Complete the multi-step registration process using the StepFlow pattern.",
+      cls=_PAGE_INTRO_CLS),
+    cls=_PAGE_HEADER_CLS
+)))
+
+
+async def render_registration_page(request, sess):
     """
     Render the complete registration page with header and workflow.
 
@@ -165,27 +224,20 @@ def render_registration_page(request, sess):
     """
     return Div(
         # Header
-        Div(
-            H1("Registration Wizard",
-               cls=combine_classes(font_size._3xl, font_weight.bold, m.b(2))),
-            P("Complete the multi-step registration process using the StepFlow pattern.",
-              cls=combine_classes(m.b(6))),
-            cls=str(m.b(6))
-        ),
+        _PAGE_HEADER,
 
         # StepFlow workflow
-        asyncio.run(registration_router.start(request, sess)),
+        await registration_router.start(request, sess),
 
-        cls=combine_classes(
-            max_w._4xl,
-            m.x.auto,
-            p(6)
-        )
+        cls=_PAGE_CLS
     )
 
 
+# The index/start handlers are async so they await the async workflow router
+# directly on the event loop, instead of being dispatched to the threadpool
+# and spinning up a fresh event loop per request with asyncio.run.
 @step_flow_ar
-def index(request, sess):
+async def index(request, sess):
     """
     StepFlow demo index route.
 
@@ -193,20 +245,12 @@ def index(request, sess):
     - HTMX requests: Returns complete page content (header + workflow)
     - Full page requests: Returns complete page with navbar and layout
     """
-    def content():
-        return render_registration_page(request, sess)
-
-    # Import navbar from demo_app to avoid circular import
-    from demo_app import navbar
-    return handle_htmx_request(
-        request,
-        content,
-        wrap_fn=lambda content: wrap_with_layout(content, navbar=navbar)
-    )
+    content = await render_registration_page(request, sess)
+    return handle_htmx_request(request, lambda: content, wrap_fn=wrap_with_demo_layout)
 
 
 @step_flow_ar
-def start(request, sess):
+async def start(request, sess):
     """
     Route for starting/resuming the workflow.
 
@@ -214,23 +258,10 @@ def start(request, sess):
     - HTMX requests: Returns just the workflow content
     - Full page requests: Returns complete page with navbar and layout
     """
-    from cjm_fasthtml_app_core.core.htmx import is_htmx_request
-
-    # For HTMX requests, delegate to workflow router's start function.
-    # registration_router.start is async; this sync wrapper handler runs in a
-    # threadpool, so asyncio.run is the correct way to drive it (mirrors the
-    # pattern in render_registration_page above).
+    # For HTMX requests, delegate to workflow router's start function
     if is_htmx_request(request):
-        return asyncio.run(registration_router.start(request, sess))
+        return await registration_router.start(request, sess)
 
     # For full page requests, return complete page with navbar
-    def content():
-        return render_registration_page(request, sess)
-
-    # Import navbar from demo_app to avoid circular import
-    from demo_app import navbar
-    return handle_htmx_request(
-        request,
-        content,
-        wrap_fn=lambda content: wrap_with_layout(content, navbar=navbar)
-    )
+    content = await render_registration_page(request, sess)
+    return handle_htmx_request(request, lambda: content, wrap_fn=wrap_with_demo_layout)
@@ -17,7 +17,11 @@ This demo showcases:
    - Support for skeleton loaders
 """
 
+import os
+import sys
+
 from fasthtml.common import *
+from starlette.middleware.gzip import GZipMiddleware
 from cjm_fasthtml_daisyui.core.resources import get_daisyui_headers
 from cjm_fasthtml_daisyui.core.testing import create_theme_persistence_script
 from cjm_fasthtml_app_core.components.navbar import create_navbar
@@ -28,9 +32,13 @@ from demo.step_flow_demo import step_flow_ar, registration_router
 from demo.async_loading_demo import async_loading_ar
 from demo.home import home_ar
 
-print("\n" + "="*70)
-print("Initializing cjm-fasthtml-interactions Demo")
-print("="*70)
+# Startup diagnostics are only printed when DEMO_VERBOSE=1
+VERBOSE = os.getenv("DEMO_VERBOSE", "0") == "1"
+
+if VERBOSE:
+    print("\n" + "="*70)
+    print("Initializing cjm-fasthtml-interactions Demo")
+    print("="*70)
 
 # Create the FastHTML app
 APP_ID = "interact"
@@ -47,25 +55,33 @@ app, rt = fast_app(
     secret_key=f'{APP_ID}-demo-secret',
 )
 
-print("✓ FastHTML app created successfully")
+# Compress larger HTML responses; the class-heavy markup compresses well and a
+# low level keeps the CPU cost per response small
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=4)
+
+if VERBOSE:
+    print("✓ FastHTML app created successfully")
 
 # Create navbar with all routes
-print("✓ Creating navbar...")
+if VERBOSE:
+    print("✓ Creating navbar...")
 navbar = create_navbar(
     title="Interactions Demo",
-    nav_items=[
+    nav_items=(
         ("Home", home_ar.index),
         ("StepFlow", step_flow_ar.index),
         ("Async Loading", async_loading_ar.index),
-    ],
+    ),
     home_route=home_ar.index,
     theme_selector=True
 )
 
-print("  ✓ Navbar created")
+if VERBOSE:
+    print("  ✓ Navbar created")
 
 # Register all routes
-print("✓ Registering routes...")
+if VERBOSE:
+    print("✓ Registering routes...")
 register_routes(
     app,
     home_ar,
@@ -74,40 +90,56 @@ register_routes(
     async_loading_ar,
 )
 
-# Debug: Print all registered routes
-print("\n" + "="*70)
-print("Registered Routes:")
-print("="*70)
-for route in app.routes:
-    if hasattr(route, 'path'):
-        print(f"  {route.path} -> {route.name if hasattr(route, 'name') else 'unknown'}")
-
-print("\n" + "="*70)
-print("Demo App Ready!")
-print("="*70)
-print("\n📦 Library Components:")
-print("  • StepFlow - Multi-step wizard pattern")
-print("  • AsyncLoadingContainer - Async content loading with loaders")
-print("  • InteractionContext - Unified context management")
-print("  • InteractionHtmlIds - Centralized ID constants")
-print("  • Step - Declarative step definition")
-print("  • LoadingType - Enum for loading indicator styles")
-print("="*70 + "\n")
+if VERBOSE:
+    # Debug: Print all registered routes
+    print("\n" + "="*70)
+    print("Registered Routes:")
+    print("="*70)
+    for route in app.routes:
+        if hasattr(route, 'path'):
+            print(f"  {route.path} -> {route.name if hasattr(route, 'name') else 'unknown'}")
+
+    print("\n" + "="*70)
+    print("Demo App Ready!")
+    print("="*70)
+    print("\n📦 Library Components:")
+    print("  • StepFlow - Multi-step wizard pattern")
+    print("  • AsyncLoadingContainer - Async content loading with loaders")
+    print("  • InteractionContext - Unified context management")
+    print("  • InteractionHtmlIds - Centralized ID constants")
+    print("  • Step - Declarative step definition")
+    print("  • LoadingType - Enum for loading indicator styles")
+    print("="*70 + "\n")
 
 
 if __name__ == "__main__":
+    import socket
+    import threading
+    import time
     import uvicorn
     import webbrowser
-    import threading
-
-    def open_browser(url):
-        print(f"🌐 Opening browser at {url}")
-        webbrowser.open(url)
 
     port = 5021
     host = "0.0.0.0"
     display_host = 'localhost' if host in ['0.0.0.0', '127.0.0.1'] else host
 
+    def open_browser(timeout=30.0):
+        """Open the demo in a browser once the server is accepting connections."""
+        # uvicorn only binds the socket after lifespan startup completes, so poll
+        # the port rather than hooking startup or guessing with a fixed delay
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                    break
+            except OSError:
+                if time.monotonic() >= deadline:
+                    return
+                time.sleep(0.1)
+        url = f"http://localhost:{port}"
+        print(f"🌐 Opening browser at {url}")
+        webbrowser.open(url)
+
     print(f"🚀 Server: http://{display_host}:{port}")
     print("\n📍 Available routes:")
     print(f"  http://{display_host}:{port}/                    - Homepage")
@@ -115,10 +147,23 @@ if __name__ == "__main__":
     print(f"  http://{display_host}:{port}/async_loading/      - AsyncLoadingContainer demo")
     print("\n" + "="*70 + "\n")
 
-    # Open browser after a short delay
-    timer = threading.Timer(1.5, lambda: open_browser(f"http://localhost:{port}"))
-    timer.daemon = True
-    timer.start()
-
-    # Start server
-    uvicorn.run(app, host=host, port=port)
+    # Open browser from a background thread once the port accepts connections,
+    # unless running headless (NO_BROWSER set, output not a terminal, or Linux
+    # without a display server)
+    headless = (
+        bool(os.getenv("NO_BROWSER"))
+        or not sys.stdout.isatty()
+        or (sys.platform.startswith("linux")
+            and not (os.getenv("DISPLAY") or os.getenv("WAYLAND_DISPLAY")))
+    )
+    if not headless:
+        threading.Thread(target=open_browser, daemon=True).start()
+
+    # Start server. uvicorn's "auto" loop/http settings pick uvloop and httptools
+    # when they are installed (pip install "uvicorn[standard]") and fall back to
+    # asyncio and h11 otherwise, so no explicit selection is needed here.
+    # Per-request access logs are debug output, so they follow DEMO_VERBOSE.
+    # Trusting X-Forwarded-* headers is deployment config: set DEMO_PROXY_HEADERS=1
+    # when serving behind a reverse proxy that terminates TLS.
+    proxy_headers = os.getenv("DEMO_PROXY_HEADERS", "0") == "1"
+    uvicorn.run(app, host=host, port=port, access_log=VERBOSE, proxy_headers=proxy_headers)